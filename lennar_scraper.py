@@ -16,16 +16,25 @@ Extracts:
 
 import argparse
 import csv
+import functools
+import heapq
 import json
 import logging
 import os
+import queue
 import re
+import threading
 import time
-from dataclasses import dataclass, asdict, field
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -33,9 +42,15 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, NoSuchElementException
+from selenium.common.exceptions import (TimeoutException, ElementClickInterceptedException,
+                                        NoSuchElementException, WebDriverException)
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +58,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used while parsing listing cards
+_CITY_RE = re.compile(r',\s*([^,]+),\s*[A-Z]{2}')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+# Beds, baths and sqft in one alternation so the details text is scanned once
+_DETAILS_RE = re.compile(
+    r'(?P<bedrooms>\d+)\s*bd'
+    r'|(?P<bathrooms>\d+(?:\.\d+)?)\s*ba'
+    r'|(?P<sqft>[\d,]+)\s*(?:sq\s*)?ft',
+    re.IGNORECASE
+)
+
+# Status keywords found in card text, mapped to canonical status, in priority order
+_STATUS_KEYWORDS = {
+    "move-in ready": "Move-In Ready",
+    "quick move": "Move-In Ready",
+    "under construction": "Under Construction",
+    "coming soon": "Coming Soon",
+}
+_STATUS_PRIORITY = ("Move-In Ready", "Under Construction", "Coming Soon")
+_STATUS_RE = re.compile("|".join(map(re.escape, _STATUS_KEYWORDS)), re.IGNORECASE)
+
+# Requests blocked in the browser (CDP URL patterns): third-party
+# analytics/consent hosts, and web fonts, which are never scraped
+_BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*optimizely.com*", "*segment.io*", "*segment.com*", "*facebook.net*",
+    "*facebook.com/tr*", "*onetrust.com*", "*cookielaw.org*",
+    "*.woff*", "*.ttf*", "*.otf*",
+]
+
+# Rendered listing card containers and the pagination button on the search results page
+_LISTING_CARD_CSS = "div[class*='InfoCard']"
+_LOAD_MORE_CSS = "button[data-testid='search-results-load-more-button']"
+
+# Precompiled CSS selectors for the fields inside a listing card
+_INFO_CARD_SEL = sv.compile("div[class*='InfoCard']")
+_CARD_SEL = sv.compile("div[class*='card' i], div[class*='listing' i]")
+_ADDRESS_SEL = sv.compile("div[class*='address' i]")
+_DETAILS_SEL = sv.compile("div[class*='metaDetails']")
+_NEW_DESCRIPTION_SEL = sv.compile("span[class*='newDescription']")
+_COMMUNITY_SEL = sv.compile("div[class*='community' i], div[class*='description' i]")
+_STATUS_SEL = sv.compile("div[class*='status' i], div[class*='pill' i]")
+_LINK_SEL = sv.compile("a[href]")
+
 
 @dataclass
 class LennarListing:
@@ -62,11 +121,220 @@ class LennarListing:
     url: str = ""
     scraped_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    def to_dict(self) -> dict:
+        """Return the listing as a plain dict (shallow; avoids asdict's recursive copy)."""
+        return {name: getattr(self, name) for name in _LISTING_FIELDS}
+
+    def to_row(self) -> tuple:
+        """Return field values in CSV_FIELDNAMES order, for csv.writer."""
+        return _listing_row(self)
+
+
+_LISTING_FIELDS = tuple(f.name for f in fields(LennarListing))
+# Pulls every field in one C-level call; returns a tuple since there are several
+_listing_row = attrgetter(*_LISTING_FIELDS)
+
+
+def _closest(tag, selector, cache: dict = None):
+    """
+    Return the nearest ancestor of tag matching a compiled soupsieve selector.
+
+    If cache is given, it maps id(node) -> nearest matching ancestor-or-self
+    for every node walked, so sibling tags in the same card stop at the
+    first shared ancestor instead of re-walking the whole chain.
+    """
+    walked = []
+    found = None
+    for parent in tag.parents:
+        if cache is not None and id(parent) in cache:
+            found = cache[id(parent)]
+            break
+        walked.append(id(parent))
+        if selector.match(parent):
+            found = parent
+            break
+    if cache is not None:
+        for node_id in walked:
+            cache[node_id] = found
+    return found
+
+
+def _has_dollar(text) -> bool:
+    return text is not None and "$" in text
+
+
+def _find_price_blocks(soup) -> list:
+    """Return every div whose text holds a "$"; each is a candidate listing price."""
+    return soup.find_all("div", string=_has_dollar)
+
+
+def _json_dumps(obj, indent: bool = True) -> bytes:
+    """
+    Serialize obj as UTF-8 JSON, using orjson when available.
+
+    Output is 2-space indented unless indent is False (one compact line).
+    LennarListing objects can be passed directly: orjson serializes
+    dataclasses natively, and the stdlib fallback converts them via to_dict.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False,
+                      separators=None if indent else (',', ':'),
+                      default=_json_default).encode('utf-8')
+
+
+# Parser for JSON read back from disk (checkpoints); picked once at import.
+# orjson.JSONDecodeError subclasses ValueError, like the stdlib error.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _ndjson_meta_path(json_path: str) -> Path:
+    """Sidecar file holding run metadata for an NDJSON export."""
+    return Path(json_path).with_suffix('.meta.json')
+
+
+def _json_default(obj):
+    if isinstance(obj, LennarListing):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Write buffer for output files; rows are small, so batch them into few syscalls
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Column order for CSV output; matches LennarListing field order so rows
+# can be written as plain tuples (see LennarListing.to_row)
+CSV_FIELDNAMES = list(_LISTING_FIELDS)
+
+
+class ListingStreamWriter:
+    """
+    Write listings to CSV and/or JSON as each market finishes.
+
+    The CSV and NDJSON output match LennarScraper.export_to_csv/export_to_json.
+    The pretty JSON document holds the same keys, but "total_listings" comes
+    after "listings", since the count is only known once the last market is
+    written. Files are opened on the first write, so an empty run creates
+    nothing.
+    """
+
+    def __init__(self, csv_path: str = None, json_path: str = None,
+                 json_format: str = "pretty"):
+        """
+        Args:
+            csv_path: Output CSV file (optional)
+            json_path: Output JSON file (optional)
+            json_format: "pretty" for one indented document, "ndjson" for one
+                listing per line plus a .meta.json sidecar
+        """
+        self.csv_path = csv_path
+        self.json_path = json_path
+        self.ndjson = json_format == "ndjson"
+        self.scraped_at = None
+        self.count = 0
+        self._csv_file = None
+        self._csv_writer = None
+        self._json_file = None
+
+    def _open(self):
+        if self.csv_path:
+            self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8',
+                                  buffering=_OUTPUT_BUFFER_SIZE)
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(CSV_FIELDNAMES)
+        if self.json_path:
+            self.scraped_at = datetime.now().isoformat()
+            self._json_file = open(self.json_path, 'wb', buffering=_OUTPUT_BUFFER_SIZE)
+            if not self.ndjson:
+                self._json_file.write(b'{\n  "scraped_at": ')
+                self._json_file.write(_json_dumps(self.scraped_at))
+                self._json_file.write(b',\n  "listings": [')
+
+    def write(self, listings: list[LennarListing]):
+        """Append a batch of listings to the open outputs."""
+        if not listings:
+            return
+        if self.count == 0:
+            self._open()
+
+        if self._csv_writer:
+            # writerows loops in C over the whole batch
+            self._csv_writer.writerows(listing.to_row() for listing in listings)
+
+        for i, listing in enumerate(listings, start=self.count):
+            if self._json_file and self.ndjson:
+                self._json_file.write(_json_dumps(listing, indent=False))
+                self._json_file.write(b'\n')
+            elif self._json_file:
+                item = _json_dumps(listing).replace(b'\n', b'\n    ')
+                self._json_file.write(b',\n    ' if i else b'\n    ')
+                self._json_file.write(item)
+        self.count += len(listings)
+
+        # One flush per market keeps finished markets on disk if the process dies
+        if self._csv_file:
+            self._csv_file.flush()
+        if self._json_file:
+            self._json_file.flush()
+
+    def close(self):
+        """Finish the JSON document and close all files."""
+        if self._csv_file:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            logger.info(f"Exported {self.count} listings to {self.csv_path}")
+        if self._json_file:
+            if self.ndjson:
+                meta = {'scraped_at': self.scraped_at, 'total_listings': self.count}
+                _ndjson_meta_path(self.json_path).write_bytes(_json_dumps(meta))
+            else:
+                self._json_file.write(f'\n  ],\n  "total_listings": {self.count}\n}}\n'.encode('utf-8'))
+            self._json_file.close()
+            self._json_file = None
+            logger.info(f"Exported {self.count} listings to {self.json_path}")
+
+
+class RateLimiter:
+    """Token bucket shared by worker threads to cap page loads per second."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens that can accumulate while idle
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 def load_market_codes(csv_path: str = None) -> dict:
     """
     Load market codes from CSV file.
 
+    Parsed files are cached per path and modification time, so repeated
+    scraper instances don't re-read an unchanged CSV.
+
     Args:
         csv_path: Path to market_codes.csv (default: same directory as script)
 
@@ -78,53 +346,66 @@ def load_market_codes(csv_path: str = None) -> dict:
         script_dir = Path(__file__).parent
         csv_path = script_dir / "market_codes.csv"
 
-    market_codes = {}
-
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                state = row['state_abbr']
-                code = row['market_code']
-                region = row['city_region']
-
-                if state not in market_codes:
-                    market_codes[state] = {}
-                market_codes[state][code] = region
-
-        logger.info(f"Loaded {sum(len(m) for m in market_codes.values())} markets from {len(market_codes)} states")
-        return market_codes
-
+        resolved = Path(csv_path).resolve()
+        market_codes = _read_market_codes(str(resolved), resolved.stat().st_mtime)
     except FileNotFoundError:
         logger.warning(f"Market codes CSV not found at {csv_path}, using fallback")
         return get_fallback_market_codes()
 
+    logger.info(f"Loaded {sum(len(m) for m in market_codes.values())} markets from {len(market_codes)} states")
+    # Copy so callers can't mutate the cached mapping
+    return {state: dict(markets) for state, markets in market_codes.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _read_market_codes(csv_path: str, mtime: float) -> dict:
+    """Parse market_codes.csv; mtime is part of the cache key so edits are picked up."""
+    market_codes = {}
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            state = row['state_abbr']
+            code = row['market_code']
+            region = row['city_region']
+
+            if state not in market_codes:
+                market_codes[state] = {}
+            market_codes[state][code] = region
+
+    return market_codes
+
+
+# Markets used when market_codes.csv is missing
+_FALLBACK_MARKET_CODES = {
+    "FL": {
+        "TMP": "Tampa / Manatee",
+        "ORL": "Orlando",
+        "JAX": "Jacksonville / St. Augustine",
+        "MIA": "Miami",
+        "FTL": "Ft. Lauderdale"
+    },
+    "TX": {
+        "DFW": "Dallas / Ft. Worth",
+        "HOU": "Houston",
+        "AUS": "Austin / Central Texas",
+        "SAT": "San Antonio"
+    },
+    "AZ": {
+        "PHX": "Phoenix",
+        "TUC": "Tucson"
+    }
+}
+
 
 def get_fallback_market_codes() -> dict:
     """Fallback market codes if CSV is not found."""
-    return {
-        "FL": {
-            "TMP": "Tampa / Manatee",
-            "ORL": "Orlando",
-            "JAX": "Jacksonville / St. Augustine",
-            "MIA": "Miami",
-            "FTL": "Ft. Lauderdale"
-        },
-        "TX": {
-            "DFW": "Dallas / Ft. Worth",
-            "HOU": "Houston",
-            "AUS": "Austin / Central Texas",
-            "SAT": "San Antonio"
-        },
-        "AZ": {
-            "PHX": "Phoenix",
-            "TUC": "Tucson"
-        }
-    }
+    return {state: dict(markets) for state, markets in _FALLBACK_MARKET_CODES.items()}
 
 
-# State name to abbreviation mapping
-STATE_ABBREV = {
+# State name to abbreviation mapping (read-only, built once at import)
+STATE_ABBREV = MappingProxyType({
     "alabama": "AL", "arizona": "AZ", "arkansas": "AR", "california": "CA",
     "colorado": "CO", "delaware": "DE", "florida": "FL", "georgia": "GA",
     "idaho": "ID", "illinois": "IL", "indiana": "IN", "kansas": "KS",
@@ -135,7 +416,21 @@ STATE_ABBREV = {
     "south-carolina": "SC", "tennessee": "TN", "texas": "TX", "utah": "UT",
     "virginia": "VA", "washington": "WA", "west virginia": "WV",
     "west-virginia": "WV", "wisconsin": "WI"
-}
+})
+
+
+_STATE_ABBREVS = frozenset(STATE_ABBREV.values())
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_state(state: str) -> str:
+    """Convert a state name or abbreviation to its two-letter abbreviation."""
+    if state in _STATE_ABBREVS:
+        return state
+    state_upper = state.upper()
+    if len(state_upper) != 2:
+        state_upper = STATE_ABBREV.get(state.lower(), state_upper[:2])
+    return state_upper
 
 
 class LennarScraper:
@@ -146,27 +441,68 @@ class LennarScraper:
 
     def __init__(self, chrome_path: str = None, headless: bool = True,
                  wait_timeout: int = 15, page_load_delay: float = 3.0,
-                 market_codes_csv: str = None):
+                 market_codes_csv: str = None, max_workers: int = 1,
+                 max_rate: float = None, cache_dir: str = None, resume: bool = False):
         """
         Initialize the scraper.
 
         Args:
             chrome_path: Path to chromedriver (optional, uses webdriver-manager if not provided)
             headless: Run browser in headless mode
-            wait_timeout: Selenium wait timeout in seconds
-            page_load_delay: Delay after page load in seconds
+            wait_timeout: Maximum wait for listings to render, in seconds
+            page_load_delay: Fallback delay when listings don't render in time, in seconds
             market_codes_csv: Path to market codes CSV file
+            max_workers: Number of markets to scrape concurrently (one browser each)
+            max_rate: Maximum market page loads per second across all workers (optional)
+            cache_dir: Directory for Chrome's HTTP cache and per-market checkpoints
+                (optional, None disables both)
+            resume: Reuse today's checkpoints instead of re-scraping finished markets
         """
         self.chrome_path = chrome_path
         self.headless = headless
         self.wait_timeout = wait_timeout
         self.page_load_delay = page_load_delay
-        self.driver = None
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        self._rate_limiter = RateLimiter(max_rate, burst=self.max_workers) if max_rate is not None else None
+        self._local = threading.local()
+        # Idle browsers; a market checks one out and returns it when done, so
+        # at most max_workers are ever started and each is reused across markets
+        self._driver_pool = queue.Queue()
+        self._cookies_accepted = set()
+        # Cache directory slot held by each live browser; a discarded browser's
+        # slot goes back on the free heap so its replacement inherits a warm cache
+        self._driver_slots_lock = threading.Lock()
+        self._driver_slots = 0
+        self._free_slots = []
+        self._slot_by_driver = {}
+        self.cache_dir = cache_dir
+        self.resume = resume
+        self._executor = None
+        self._stream: Optional[ListingStreamWriter] = None
+        self.streamed_count = 0
         self.listings: list[LennarListing] = []
+        # Listings per "STATE/CODE" from the last scrape_all, kept even when
+        # the listings themselves are only streamed to disk
+        self.market_counts: Counter = Counter()
 
         # Load market codes from CSV
         self.market_codes = load_market_codes(market_codes_csv)
 
+        # Checkpoints are only ever read back on the day they were written
+        if self.cache_dir:
+            self._prune_checkpoints()
+
+    @property
+    def driver(self):
+        """WebDriver checked out from the pool by the calling thread."""
+        return getattr(self._local, 'driver', None)
+
+    @driver.setter
+    def driver(self, value):
+        self._local.driver = value
+
     def _setup_driver(self):
         """Initialize Selenium WebDriver."""
         if self.driver is not None:
@@ -183,31 +519,142 @@ class LennarScraper:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
 
-        # Use provided path or webdriver-manager
-        if self.chrome_path:
-            service = Service(self.chrome_path)
-        else:
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-            except ImportError:
-                logger.warning("webdriver-manager not installed, trying default chromedriver")
-                service = Service()
+        # Listing photos are never scraped; skip downloading them (fonts are
+        # blocked via _BLOCKED_URL_PATTERNS). Stylesheets stay enabled since
+        # button visibility checks depend on them.
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+        # Return from driver.get() at DOMContentLoaded; _wait_for_results waits for listings
+        options.page_load_strategy = 'eager'
+
+        # Persistent HTTP cache so unchanged assets are not re-downloaded on later runs.
+        # Each browser gets its own slot directory since Chrome locks its cache.
+        slot = None
+        if self.cache_dir:
+            slot = self._claim_cache_slot()
+            cache_path = Path(self.cache_dir).resolve() / f"worker-{slot}"
+            cache_path.mkdir(parents=True, exist_ok=True)
+            options.add_argument(f'--disk-cache-dir={cache_path}')
 
-        self.driver = webdriver.Chrome(service=service, options=options)
+        try:
+            # Use provided path or webdriver-manager
+            if self.chrome_path:
+                service = Service(self.chrome_path)
+            else:
+                try:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    service = Service(ChromeDriverManager().install())
+                except ImportError:
+                    logger.warning("webdriver-manager not installed, trying default chromedriver")
+                    service = Service()
+
+            self.driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            if slot is not None:
+                self._release_cache_slot(slot)
+            raise
+        if slot is not None:
+            with self._driver_slots_lock:
+                self._slot_by_driver[self.driver] = slot
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.debug(f"Could not block tracker URLs: {e}")
         logger.info("WebDriver initialized")
 
+    def _claim_cache_slot(self) -> int:
+        """Return the lowest free worker-N cache slot, or a new one if all are in use."""
+        with self._driver_slots_lock:
+            if self._free_slots:
+                return heapq.heappop(self._free_slots)
+            slot = self._driver_slots
+            self._driver_slots += 1
+            return slot
+
+    def _release_cache_slot(self, slot: int):
+        """Make a cache slot available to the next browser that starts."""
+        with self._driver_slots_lock:
+            heapq.heappush(self._free_slots, slot)
+
+    def _quit_driver(self, driver):
+        """Quit a WebDriver and free its cache slot once Chrome has released it."""
+        self._cookies_accepted.discard(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error closing WebDriver: {e}")
+        with self._driver_slots_lock:
+            slot = self._slot_by_driver.pop(driver, None)
+        if slot is not None:
+            self._release_cache_slot(slot)
+
+    def _acquire_driver(self):
+        """Check out an idle WebDriver for the calling thread, starting one if none is free."""
+        if self.driver is not None:
+            return
+        try:
+            self.driver = self._driver_pool.get_nowait()
+        except queue.Empty:
+            self._setup_driver()
+
+    def _release_driver(self):
+        """Return the calling thread's WebDriver to the pool for the next market."""
+        if self.driver is not None:
+            self._driver_pool.put(self.driver)
+            self.driver = None
+
+    def _discard_driver(self):
+        """Quit and forget the calling thread's WebDriver."""
+        driver = self.driver
+        if driver is None:
+            return
+        self._quit_driver(driver)
+        self.driver = None
+
+    def _wait_for_results(self):
+        """
+        Wait until the search page has rendered listing cards.
+
+        Returns as soon as the DOM is parsed and a listing card (or the
+        "Load more" button) is present, instead of sleeping a fixed delay.
+        Falls back to sleeping page_load_delay if nothing shows up within
+        wait_timeout.
+        """
+        try:
+            wait = WebDriverWait(self.driver, self.wait_timeout)
+            wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR,
+                f"{_LISTING_CARD_CSS}, {_LOAD_MORE_CSS}")))
+        except TimeoutException:
+            logger.debug("Listings did not appear before timeout, falling back to fixed delay")
+            time.sleep(self.page_load_delay)
+
     def _accept_cookies(self):
-        """Handle cookie consent popup."""
+        """Handle cookie consent popup (once per browser session)."""
+        if self.driver in self._cookies_accepted:
+            return
+        accept_locator = (By.ID, "onetrust-accept-btn-handler")
         try:
             wait = WebDriverWait(self.driver, 5)
-            accept_btn = wait.until(EC.element_to_be_clickable((By.ID, "onetrust-accept-btn-handler")))
-            accept_btn.click()
-            logger.debug("Accepted cookies")
-            time.sleep(0.5)
+            accept_btn = wait.until(EC.element_to_be_clickable(accept_locator))
         except TimeoutException:
+            # Consent scripts are normally blocked, so the banner rarely appears;
+            # don't wait for it again on this browser
+            self._cookies_accepted.add(self.driver)
             logger.debug("No cookie popup found")
+            return
+
+        accept_btn.click()
+        self._cookies_accepted.add(self.driver)
+        logger.debug("Accepted cookies")
+        # Let the banner close so it doesn't intercept the "Load more" click
+        try:
+            wait.until(EC.invisibility_of_element_located(accept_locator))
+        except TimeoutException:
+            pass  # _load_all_homes falls back to a JavaScript click
 
     def _load_all_homes(self, max_clicks: int = 100) -> int:
         """
@@ -223,12 +670,13 @@ class LennarScraper:
         consecutive_failures = 0
         max_consecutive_failures = 3
 
+        load_more_locator = (By.CSS_SELECTOR, _LOAD_MORE_CSS)
+
         while click_count < max_clicks and consecutive_failures < max_consecutive_failures:
             try:
                 # Wait for the button with longer timeout
                 load_more = WebDriverWait(self.driver, 8).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR,
-                        "button[data-testid='search-results-load-more-button']"))
+                    EC.presence_of_element_located(load_more_locator)
                 )
 
                 # Check if button is visible and enabled
@@ -236,12 +684,17 @@ class LennarScraper:
                     logger.debug("Load more button not visible, all homes loaded")
                     break
 
-                # Scroll button into view
+                # Jump the button into view (no smooth-scroll animation to wait out)
                 self.driver.execute_script(
-                    "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
+                    "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
                     load_more
                 )
-                time.sleep(1)
+                try:
+                    WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(load_more_locator))
+                except TimeoutException:
+                    pass  # Fall through; the JavaScript click below handles overlays
+
+                cards_before = len(self.driver.find_elements(By.CSS_SELECTOR, _LISTING_CARD_CSS))
 
                 # Try to click
                 try:
@@ -254,8 +707,13 @@ class LennarScraper:
                 consecutive_failures = 0
                 logger.debug(f"Clicked 'Load more homes' (#{click_count})")
 
-                # Wait for new content to load
-                time.sleep(2)
+                # Wait for the new batch of cards instead of a fixed delay
+                try:
+                    WebDriverWait(self.driver, 10).until(
+                        lambda d: len(d.find_elements(By.CSS_SELECTOR, _LISTING_CARD_CSS)) > cards_before
+                    )
+                except TimeoutException:
+                    logger.debug("No new cards appeared after clicking 'Load more'")
 
             except TimeoutException:
                 consecutive_failures += 1
@@ -271,28 +729,30 @@ class LennarScraper:
 
         return click_count
 
-    def _scroll_to_load_all(self):
-        """Scroll through the page to ensure lazy-loaded content appears."""
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        scroll_attempts = 0
-        max_scroll_attempts = 10
+    def _scroll_to_load_all(self, max_rounds: int = 20):
+        """
+        Scroll through the page to ensure lazy-loaded content appears.
 
-        while scroll_attempts < max_scroll_attempts:
-            # Scroll down
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.5)
+        After each scroll, waits (briefly) for the page to grow or for more
+        listing cards to render, and stops as soon as nothing new arrives.
+        """
+        height_js = "return document.body.scrollHeight"
 
-            # Check if we've reached the bottom
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                scroll_attempts += 1
-            else:
-                scroll_attempts = 0
-                last_height = new_height
+        for _ in range(max_rounds):
+            last_height = self.driver.execute_script(height_js)
+            last_cards = len(self.driver.find_elements(By.CSS_SELECTOR, _LISTING_CARD_CSS))
+
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(self.driver, 3).until(
+                    lambda d: d.execute_script(height_js) > last_height
+                    or len(d.find_elements(By.CSS_SELECTOR, _LISTING_CARD_CSS)) > last_cards
+                )
+            except TimeoutException:
+                break
 
         # Scroll back to top
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
 
     def _parse_listings(self, soup: BeautifulSoup, state: str,
                         market_code: str, market_name: str) -> list[LennarListing]:
@@ -309,27 +769,32 @@ class LennarScraper:
             List of parsed listings
         """
         listings = []
+        # Cards already parsed; a card can hold several "$" blocks (price, payment, ...)
+        parsed_cards = set()
+        # Ancestor lookups shared by all price blocks on the page
+        info_card_cache = {}
+        card_cache = {}
+        # One timestamp per page; every card on it was captured at the same moment
+        scraped_at = datetime.now().isoformat()
 
         # Find all price blocks as entry points
-        price_blocks = soup.find_all("div", string=lambda text: text and "$" in text)
+        price_blocks = _find_price_blocks(soup)
         logger.debug(f"Found {len(price_blocks)} price blocks")
 
         for price_block in price_blocks:
             try:
-                listing = LennarListing()
-                listing.state = state
-                listing.market_code = market_code
-                listing.market = market_name
+                listing = LennarListing(state=state, market_code=market_code,
+                                        market=market_name, scraped_at=scraped_at)
 
                 # Get price
                 listing.price = price_block.text.strip()
                 listing.price_numeric = self._parse_price(listing.price)
 
                 # Find parent card - look for InfoCard or similar container
-                card = price_block.find_parent("div", class_=lambda x: x and "InfoCard" in x)
+                card = _closest(price_block, _INFO_CARD_SEL, info_card_cache)
                 if not card:
                     # Try alternative parent patterns
-                    card = price_block.find_parent("div", class_=lambda x: x and ("card" in x.lower() or "listing" in x.lower()))
+                    card = _closest(price_block, _CARD_SEL, card_cache)
                 if not card:
                     # Go up a few levels
                     card = price_block
@@ -339,47 +804,42 @@ class LennarScraper:
                         if card.name == "article" or (card.get("class") and any("card" in c.lower() for c in card.get("class", []))):
                             break
 
-                if not card:
+                if not card or id(card) in parsed_cards:
                     continue
+                parsed_cards.add(id(card))
 
                 # Extract address
-                addr_elem = card.find("div", class_=lambda x: x and "address" in x.lower()) if card else None
+                addr_elem = _ADDRESS_SEL.select_one(card)
                 if addr_elem:
                     listing.address = addr_elem.text.strip()
                     # Try to extract city from address
-                    city_match = re.search(r',\s*([^,]+),\s*[A-Z]{2}', listing.address)
+                    city_match = _CITY_RE.search(listing.address)
                     if city_match:
                         listing.city = city_match.group(1).strip()
 
                 # Extract details (beds, baths, sqft)
-                details_elem = card.find("div", class_=lambda x: x and "metaDetails" in x) if card else None
+                details_elem = _DETAILS_SEL.select_one(card)
                 if details_elem:
                     raw_details = details_elem.text.strip()
                     self._parse_details(listing, raw_details)
 
                 # Extract community
-                comm_elem = card.find("span", class_=lambda x: x and "newDescription" in x) if card else None
+                comm_elem = _NEW_DESCRIPTION_SEL.select_one(card)
                 if not comm_elem:
-                    comm_elem = card.find("div", class_=lambda x: x and ("community" in x.lower() or "description" in x.lower())) if card else None
+                    comm_elem = _COMMUNITY_SEL.select_one(card)
                 if comm_elem:
                     listing.community = comm_elem.text.strip()
 
                 # Extract status
-                status_elem = card.find("div", class_=lambda x: x and ("status" in x.lower() or "pill" in x.lower())) if card else None
+                status_elem = _STATUS_SEL.select_one(card)
                 if status_elem:
                     listing.status = status_elem.text.strip()
                 else:
                     # Check for status keywords in card text
-                    card_text = card.get_text().lower() if card else ""
-                    if "move-in ready" in card_text or "quick move" in card_text:
-                        listing.status = "Move-In Ready"
-                    elif "under construction" in card_text:
-                        listing.status = "Under Construction"
-                    elif "coming soon" in card_text:
-                        listing.status = "Coming Soon"
+                    listing.status = self._status_from_text(card.get_text())
 
                 # Extract URL
-                link = card.find("a", href=True) if card else None
+                link = _LINK_SEL.select_one(card)
                 if link:
                     href = link.get("href", "")
                     if href.startswith("/"):
@@ -396,9 +856,17 @@ class LennarScraper:
 
         return listings
 
+    def _status_from_text(self, text: str) -> str:
+        """Find the highest-priority status keyword in text with a single scan."""
+        found = {_STATUS_KEYWORDS[m.group(0).lower()] for m in _STATUS_RE.finditer(text)}
+        for status in _STATUS_PRIORITY:
+            if status in found:
+                return status
+        return ""
+
     def _parse_price(self, price_text: str) -> Optional[int]:
         """Extract numeric price from price text."""
-        clean = re.sub(r'[^\d]', '', price_text)
+        clean = _NON_DIGIT_RE.sub('', price_text)
         if clean:
             try:
                 return int(clean)
@@ -408,20 +876,19 @@ class LennarScraper:
 
     def _parse_details(self, listing: LennarListing, details_text: str):
         """Parse beds, baths, sqft from details string."""
-        # Bedrooms
-        bed_match = re.search(r'(\d+)\s*bd', details_text, re.IGNORECASE)
-        if bed_match:
-            listing.bedrooms = int(bed_match.group(1))
-
-        # Bathrooms
-        bath_match = re.search(r'(\d+(?:\.\d+)?)\s*ba', details_text, re.IGNORECASE)
-        if bath_match:
-            listing.bathrooms = float(bath_match.group(1))
+        found = {}
+        for match in _DETAILS_RE.finditer(details_text):
+            # Keep the first value seen for each field
+            found.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if len(found) == 3:
+                break
 
-        # Square feet
-        sqft_match = re.search(r'([\d,]+)\s*(?:sq\s*)?ft', details_text, re.IGNORECASE)
-        if sqft_match:
-            listing.sqft = int(sqft_match.group(1).replace(',', ''))
+        if 'bedrooms' in found:
+            listing.bedrooms = int(found['bedrooms'])
+        if 'bathrooms' in found:
+            listing.bathrooms = float(found['bathrooms'])
+        if 'sqft' in found:
+            listing.sqft = int(found['sqft'].replace(',', ''))
 
     def scrape_market(self, state: str, market_code: str,
                       market_name: str) -> list[LennarListing]:
@@ -436,33 +903,92 @@ class LennarScraper:
         Returns:
             List of listings from this market
         """
-        self._setup_driver()
-
-        url = f"{self.SEARCH_URL}?state={state}&market={market_code}"
-        logger.info(f"Scraping {market_name} ({state}/{market_code})...")
-
-        self.driver.get(url)
-        time.sleep(self.page_load_delay)
-
-        # Handle cookie popup
-        self._accept_cookies()
+        checkpoint = self._checkpoint_path(state, market_code)
+        if checkpoint and self.resume:
+            listings = self._load_checkpoint(checkpoint)
+            if listings is not None:
+                logger.info(f"Loaded {len(listings)} listings for {market_name} from checkpoint")
+                return listings
+
+        self._acquire_driver()
+        try:
+            url = f"{self.SEARCH_URL}?state={state}&market={market_code}"
+            logger.info(f"Scraping {market_name} ({state}/{market_code})...")
 
-        # Load all homes by clicking "Load more"
-        clicks = self._load_all_homes()
-        logger.info(f"Clicked 'Load more' {clicks} times")
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            try:
+                self.driver.get(url)
+            except WebDriverException as e:
+                # Browser crashed or session was lost; start a fresh one and retry once
+                logger.warning(f"WebDriver session lost ({e.msg}), restarting browser")
+                self._discard_driver()
+                self._setup_driver()
+                self.driver.get(url)
+            self._wait_for_results()
+
+            # Handle cookie popup
+            self._accept_cookies()
+
+            # Load all homes by clicking "Load more"
+            clicks = self._load_all_homes()
+            logger.info(f"Clicked 'Load more' {clicks} times")
+
+            # Additional scroll to ensure all content is loaded
+            self._scroll_to_load_all()
+
+            # Parse the whole page once; listing cards have no stable container
+            # markup that a parse filter could key on without losing some of them
+            soup = BeautifulSoup(self.driver.page_source, "lxml")
+            listings = self._parse_listings(soup, state, market_code, market_name)
+        finally:
+            self._release_driver()
 
-        # Additional scroll to ensure all content is loaded
-        self._scroll_to_load_all()
+        logger.info(f"Found {len(listings)} listings in {market_name}")
+        # An empty page is more likely a failed load than an empty market; retry it next run
+        if checkpoint and listings:
+            self._save_checkpoint(checkpoint, listings)
+        return listings
 
-        # Wait a bit more for any final content
-        time.sleep(2)
+    def _checkpoint_path(self, state: str, market_code: str) -> Optional[Path]:
+        """Return today's checkpoint file for a market, or None if caching is off."""
+        if not self.cache_dir:
+            return None
+        return Path(self.cache_dir) / "checkpoints" / f"{state}_{market_code}_{date.today().isoformat()}.json"
 
-        # Parse the page
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        listings = self._parse_listings(soup, state, market_code, market_name)
+    def _prune_checkpoints(self):
+        """Delete checkpoints (and leftover temp files) from earlier days."""
+        checkpoint_dir = Path(self.cache_dir) / "checkpoints"
+        if not checkpoint_dir.is_dir():
+            return
+        today_suffix = f"_{date.today().isoformat()}"
+        for path in checkpoint_dir.iterdir():
+            if path.suffix in (".json", ".tmp") and not path.stem.endswith(today_suffix):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.debug(f"Could not remove old checkpoint {path}: {e}")
 
-        logger.info(f"Found {len(listings)} listings in {market_name}")
-        return listings
+    def _load_checkpoint(self, path: Path) -> Optional[list[LennarListing]]:
+        """Read listings saved by a previous run, or None if there is no usable checkpoint."""
+        try:
+            data = _json_loads(path.read_bytes())
+            return [LennarListing(**item) for item in data]
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+    def _save_checkpoint(self, path: Path, listings: list[LennarListing]):
+        """Write a market's listings atomically so interrupted runs can skip it."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(_json_dumps(listings))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write checkpoint {path}: {e}")
 
     def scrape_state(self, state: str) -> list[LennarListing]:
         """
@@ -474,50 +1000,124 @@ class LennarScraper:
         Returns:
             List of all listings from the state
         """
-        # Normalize state to abbreviation
-        state_upper = state.upper()
-        if len(state_upper) != 2:
-            state_upper = STATE_ABBREV.get(state.lower(), state.upper()[:2])
+        jobs = self._market_jobs(state)
+        if not jobs:
+            return []
+        return self._scrape_markets(jobs, desc=f"Markets in {jobs[0][0]}")
+
+    def _market_jobs(self, state: str) -> list[tuple[str, str, str]]:
+        """Return (state, market_code, market_name) jobs for every market in a state."""
+        state_upper = _normalize_state(state)
 
         if state_upper not in self.market_codes:
             logger.warning(f"No market codes found for state: {state}")
             return []
 
         markets = self.market_codes[state_upper]
-        all_listings = []
+        return [(state_upper, code, name) for code, name in markets.items()]
 
-        for code, name in tqdm(markets.items(), desc=f"Markets in {state_upper}"):
-            try:
-                listings = self.scrape_market(state_upper, code, name)
-                all_listings.extend(listings)
-            except Exception as e:
-                logger.error(f"Error scraping {name}: {e}")
+    def _scrape_markets(self, jobs: list[tuple[str, str, str]], desc: str,
+                        keep_listings: bool = True) -> list[LennarListing]:
+        """
+        Scrape a batch of markets, up to max_workers at a time.
 
-        return all_listings
+        Args:
+            jobs: List of (state, market_code, market_name) tuples
+            desc: Progress bar label
+            keep_listings: Hold every market's listings for the return value;
+                if False, they are only passed to the stream writer
+
+        Returns:
+            Listings from all markets, in the order of jobs (empty if
+            keep_listings is False)
+        """
+        results = [[] for _ in jobs]
+
+        def collect(i: int, listings: list[LennarListing]):
+            state, market_code = jobs[i][:2]
+            if listings:
+                self.market_counts[f"{state}/{market_code}"] += len(listings)
+            if keep_listings:
+                results[i] = listings
+            if self._stream:
+                self._stream.write(listings)
+
+        # Each market only needs scraping once, even if a state was requested twice
+        unique_jobs = {}
+        for i, job in enumerate(jobs):
+            unique_jobs.setdefault(job[:2], i)
+
+        # Only scraping errors are per-market; an output error (e.g. disk full)
+        # propagates and ends the run rather than silently dropping rows
+        if self.max_workers == 1:
+            for i in tqdm(unique_jobs.values(), desc=desc):
+                try:
+                    listings = self.scrape_market(*jobs[i])
+                except Exception as e:
+                    logger.error(f"Error scraping {jobs[i][2]}: {e}")
+                    continue
+                collect(i, listings)
+        else:
+            executor = self._get_executor()
+            futures = {executor.submit(self.scrape_market, *jobs[i]): i for i in unique_jobs.values()}
+            for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+                i = futures[future]
+                try:
+                    listings = future.result()
+                except Exception as e:
+                    logger.error(f"Error scraping {jobs[i][2]}: {e}")
+                    continue
+                collect(i, listings)
+
+        return [listing for market_listings in results for listing in market_listings]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool, kept for the scraper's lifetime so browsers are reused."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="market")
+        return self._executor
 
-    def scrape_all(self, states: list[str] = None) -> list[LennarListing]:
+    def scrape_all(self, states: list[str] = None, csv_path: str = None,
+                   json_path: str = None, json_format: str = "pretty",
+                   keep_listings: bool = True) -> list[LennarListing]:
         """
         Scrape all listings from specified states (or all states).
 
         Args:
             states: List of states to scrape (None for all)
+            csv_path: Stream listings to this CSV file as markets finish (optional)
+            json_path: Stream listings to this JSON file as markets finish (optional)
+            json_format: "pretty" or "ndjson" layout for json_path
+            keep_listings: Keep all listings in memory (self.listings); pass
+                False when streaming so memory doesn't grow with the run
 
         Returns:
-            List of all scraped listings
+            List of all scraped listings (empty if keep_listings is False)
         """
         if states:
             states_to_scrape = states
         else:
             states_to_scrape = list(self.market_codes.keys())
 
-        all_listings = []
+        # Queue every market up front so workers are not idle at state boundaries
+        jobs = []
+        for state in states_to_scrape:
+            jobs.extend(self._market_jobs(state))
 
-        for state in tqdm(states_to_scrape, desc="States"):
-            try:
-                listings = self.scrape_state(state)
-                all_listings.extend(listings)
-            except Exception as e:
-                logger.error(f"Error scraping state {state}: {e}")
+        if csv_path or json_path:
+            self._stream = ListingStreamWriter(csv_path, json_path, json_format)
+
+        self.market_counts = Counter()
+        try:
+            all_listings = self._scrape_markets(jobs, desc="Markets",
+                                                keep_listings=keep_listings)
+        finally:
+            # Also runs on Ctrl-C, leaving valid files with every finished market
+            if self._stream:
+                self._stream.close()
+                self.streamed_count = self._stream.count
+                self._stream = None
 
         self.listings = all_listings
         return all_listings
@@ -528,10 +1128,7 @@ class LennarScraper:
 
     def get_markets_for_state(self, state: str) -> dict:
         """Return market codes for a specific state."""
-        state_upper = state.upper()
-        if len(state_upper) != 2:
-            state_upper = STATE_ABBREV.get(state.lower(), state.upper()[:2])
-        return self.market_codes.get(state_upper, {})
+        return self.market_codes.get(_normalize_state(state), {})
 
     def export_to_csv(self, filepath: str = "lennar_listings.csv") -> str:
         """Export listings to CSV."""
@@ -539,17 +1136,10 @@ class LennarScraper:
             logger.warning("No listings to export")
             return ""
 
-        fieldnames = [
-            'address', 'city', 'state', 'price', 'price_numeric',
-            'bedrooms', 'bathrooms', 'sqft', 'community', 'status',
-            'market', 'market_code', 'url', 'scraped_at'
-        ]
-
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for listing in self.listings:
-                writer.writerow(asdict(listing))
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(listing.to_row() for listing in self.listings)
 
         logger.info(f"Exported {len(self.listings)} listings to {filepath}")
         return filepath
@@ -566,34 +1156,86 @@ class LennarScraper:
             logger.warning("No listings to export")
             return ""
 
-        df = pd.DataFrame([asdict(l) for l in self.listings])
+        df = pd.DataFrame([l.to_dict() for l in self.listings])
         df.to_excel(filepath, index=False)
         logger.info(f"Exported {len(self.listings)} listings to {filepath}")
         return filepath
 
-    def export_to_json(self, filepath: str = "lennar_listings.json") -> str:
-        """Export listings to JSON."""
+    def export_to_json(self, filepath: str = "lennar_listings.json",
+                       json_format: str = "pretty") -> str:
+        """
+        Export listings to JSON.
+
+        Args:
+            filepath: Output file
+            json_format: "pretty" for one indented document, "ndjson" for one
+                listing per line plus a .meta.json sidecar with run metadata
+        """
         if not self.listings:
             logger.warning("No listings to export")
             return ""
 
-        data = {
+        meta = {
             'scraped_at': datetime.now().isoformat(),
             'total_listings': len(self.listings),
-            'listings': [asdict(l) for l in self.listings]
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb', buffering=_OUTPUT_BUFFER_SIZE) as f:
+            if json_format == "ndjson":
+                for listing in self.listings:
+                    f.write(_json_dumps(listing, indent=False))
+                    f.write(b'\n')
+            else:
+                f.write(_json_dumps({**meta, 'listings': self.listings}))
+
+        if json_format == "ndjson":
+            _ndjson_meta_path(filepath).write_bytes(_json_dumps(meta))
 
         logger.info(f"Exported {len(self.listings)} listings to {filepath}")
         return filepath
 
     def close(self):
         """Clean up resources."""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
+        if self._executor is not None:
+            # Drop queued markets so an interrupted run stops promptly
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        # Workers have finished, so every browser is back in the pool
+        self._release_driver()
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_driver(driver)
+
+
+def _ensure_writable(path):
+    """Create the parent directory and verify that path can be opened for writing."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    existed = target.exists()
+    with open(target, 'a'):
+        pass
+    if not existed:
+        target.unlink()
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a whole number >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """argparse type for options that must be a number > 0."""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
 
 
 def main():
@@ -637,8 +1279,20 @@ Market codes are loaded from market_codes.csv in the same directory.
     parser.add_argument('--output-csv', default='lennar_listings.csv', help='Output CSV file')
     parser.add_argument('--output-excel', help='Output Excel file (optional)')
     parser.add_argument('--output-json', default='lennar_listings.json', help='Output JSON file')
-    parser.add_argument('--timeout', type=int, default=15, help='Selenium wait timeout')
-    parser.add_argument('--delay', type=float, default=3.0, help='Page load delay')
+    parser.add_argument('--json-format', choices=['pretty', 'ndjson'], default='pretty',
+                        help='JSON layout: one indented document, or one listing per line')
+    parser.add_argument('--timeout', type=int, default=15, help='Maximum wait for listings to render')
+    parser.add_argument('--delay', type=float, default=3.0, help="Fallback page load delay if listings don't render in time")
+    parser.add_argument('--workers', type=_positive_int, default=1,
+                        help='Markets to scrape concurrently (one browser each)')
+    parser.add_argument('--max-rate', type=_positive_float,
+                        help='Maximum market page loads per second across all workers')
+    parser.add_argument('--cache-dir', default='.lennar_cache',
+                        help='Directory for the browser HTTP cache and per-market checkpoints')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the browser cache and market checkpoints')
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip markets that already have a checkpoint from today")
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
 
     args = parser.parse_args()
@@ -646,12 +1300,27 @@ Market codes are loaded from market_codes.csv in the same directory.
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Check output paths up front so a long scrape isn't lost to a bad path at export time
+    if not (args.list_states or args.list_markets):
+        outputs = [args.output_csv, args.output_json, args.output_excel]
+        if args.json_format == 'ndjson':
+            outputs.append(_ndjson_meta_path(args.output_json))
+        for path in filter(None, outputs):
+            try:
+                _ensure_writable(path)
+            except OSError as e:
+                parser.error(f"cannot write output file {path}: {e}")
+
     scraper = LennarScraper(
         chrome_path=args.chrome_path,
         headless=not args.no_headless,
         wait_timeout=args.timeout,
         page_load_delay=args.delay,
-        market_codes_csv=args.market_codes_csv
+        market_codes_csv=args.market_codes_csv,
+        max_workers=args.workers,
+        max_rate=args.max_rate,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        resume=args.resume
     )
 
     try:
@@ -682,14 +1351,19 @@ Market codes are loaded from market_codes.csv in the same directory.
             market_name = scraper.market_codes.get(state, {}).get(market, market)
             listings = scraper.scrape_market(state, market, market_name)
             scraper.listings = listings
+            streamed = False
 
         elif args.states:
-            # Scrape specified states
-            scraper.scrape_all(args.states)
+            # Scrape specified states, streaming to CSV/JSON as markets finish
+            scraper.scrape_all(args.states, csv_path=args.output_csv, json_path=args.output_json,
+                               json_format=args.json_format, keep_listings=bool(args.output_excel))
+            streamed = True
 
         elif args.all:
-            # Scrape everything
-            scraper.scrape_all()
+            # Scrape everything, streaming to CSV/JSON as markets finish
+            scraper.scrape_all(csv_path=args.output_csv, json_path=args.output_json,
+                               json_format=args.json_format, keep_listings=bool(args.output_excel))
+            streamed = True
 
         else:
             print("No states specified. Use --states, --all, or --state with --market")
@@ -697,27 +1371,29 @@ Market codes are loaded from market_codes.csv in the same directory.
             print("Example: python lennar_scraper.py --states FL TX")
             return
 
-        # Export results
-        if scraper.listings:
-            scraper.export_to_csv(args.output_csv)
-            scraper.export_to_json(args.output_json)
+        # Export results; streamed runs only keep listings in memory for Excel
+        total = scraper.streamed_count if streamed else len(scraper.listings)
+        if total:
+            if not streamed:
+                scraper.export_to_csv(args.output_csv)
+                scraper.export_to_json(args.output_json, json_format=args.json_format)
             if args.output_excel:
                 scraper.export_to_excel(args.output_excel)
 
             print(f"\n{'='*60}")
             print("Scraping Complete!")
             print(f"{'='*60}")
-            print(f"Total listings found: {len(scraper.listings)}")
+            print(f"Total listings found: {total}")
             print(f"CSV output: {args.output_csv}")
             print(f"JSON output: {args.output_json}")
             if args.output_excel:
                 print(f"Excel output: {args.output_excel}")
 
             # Show breakdown by market
-            market_counts = {}
-            for l in scraper.listings:
-                key = f"{l.state}/{l.market_code}"
-                market_counts[key] = market_counts.get(key, 0) + 1
+            if streamed:
+                market_counts = scraper.market_counts
+            else:
+                market_counts = Counter(f"{l.state}/{l.market_code}" for l in scraper.listings)
 
             print(f"\nListings by market:")
             for market, count in sorted(market_counts.items()):
@@ -729,6 +1405,9 @@ Market codes are loaded from market_codes.csv in the same directory.
 
     except KeyboardInterrupt:
         print("\nScraping interrupted")
+        if scraper.streamed_count:
+            print(f"{scraper.streamed_count} listings from completed markets were saved to "
+                  f"{args.output_csv} and {args.output_json}")
     except Exception as e:
         logger.error(f"Scraping failed: {e}")
         raise